@@ -0,0 +1,56 @@
+# backend/crud.py
+from typing import Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from models import ActionType, Event
+from schemas import ActionCode, EventCreate
+
+# Translates the wire enum (ActionCode, integer-valued) to the storage
+# enum (ActionType, string-valued) at the persistence boundary. The
+# generic frontend "turnover" is recorded as a throwaway; opponent-side
+# events have no ActionType counterpart yet and are stored with a NULL
+# action.
+_ACTION_TYPE_BY_CODE = {
+    ActionCode.CATCH: ActionType.CATCH,
+    ActionCode.PULL: ActionType.PULL,
+    ActionCode.TURNOVER: ActionType.THROWAWAY,
+    ActionCode.GOAL: ActionType.GOAL,
+    ActionCode.BLOCK: ActionType.DEFENSE_BLOCK,
+    ActionCode.OPPONENT_TURN: None,
+    ActionCode.OPPONENT_SCORE: None,
+}
+
+
+def bulk_insert_events(
+    db: Session,
+    point_id: int,
+    events: List[EventCreate],
+    player_ids: Dict[str, int],
+) -> None:
+    """
+    Persists a whole event sequence as ONE multi-row INSERT and one commit.
+    Adding rows one at a time with db.add() + db.commit() makes SQLite
+    fsync per event; here the whole batch hits the journal once.
+
+    player_ids maps player_name (as sent by the frontend) to Player.id.
+    """
+    if not events:
+        return
+
+    db.execute(
+        insert(Event),
+        [
+            {
+                "point_id": point_id,
+                "player_id": player_ids.get(e.player_name),
+                "action_type": _ACTION_TYPE_BY_CODE[e.action_type],
+                "x_coordinate": e.x,
+                "y_coordinate": e.y,
+                "timestamp": e.timestamp,
+            }
+            for e in events
+        ],
+    )
+    db.commit()
@@ -1,35 +1,72 @@
 # backend/main.py
-from fastapi import FastAPI, Depends
+import os
+
+from fastapi import FastAPI, Depends, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 from typing import List  # <--- THIS WAS MISSING
 
+from sqlalchemy import select
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
+
 from database import engine, Base, get_db
 import models
-from schemas import GameSequence, PlayerStats
+from schemas import PLAYER_STATS_LIST, GameSequence, PlayerOut, PlayerStats
 from stats_engine import process_game_events
 
-# Create the database tables automatically
-models.Base.metadata.create_all(bind=engine)
+# Create the database tables on demand (RUN_MIGRATIONS=1) rather than on
+# every worker boot; all models register on the single Base from database.py
+if os.environ.get("RUN_MIGRATIONS"):
+    Base.metadata.create_all(bind=engine)
 
 app = FastAPI()
 
-# Allow the frontend to talk to the backend (CORS)
+# Allow the frontend to talk to the backend (CORS). A compiled origin
+# regex is one re.match per request instead of a list scan, and the API
+# uses no cookies so the credential-echo branch can be skipped entirely.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173"], 
-    allow_credentials=True,
+    allow_origin_regex=r"^http://localhost:5173$",
+    allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def init_cache():
+    # In-memory response cache; the roster changes rarely, so most
+    # /players/ hits never touch the database
+    FastAPICache.init(InMemoryBackend(), prefix="uft")
+
+# An annotated return type (like response_model on the other routes) lets
+# FastAPI serialize straight to JSON bytes via pydantic-core instead of
+# going through jsonable_encoder + stdlib json
 @app.get("/")
-def read_root():
+def read_root() -> dict:
     return {"message": "Ultimate Frisbee Stats API is running!"}
 
-@app.get("/players/")
+def roster_cache_key(func, namespace="", *, request=None, response=None, args=(), kwargs=None):
+    # Default key builder hashes the per-request db session too, which
+    # would make every request a cache miss
+    return f"{FastAPICache.get_prefix()}:{namespace}:{func.__module__}:{func.__name__}"
+
+@app.get("/players/", response_model=List[PlayerOut])
+@cache(expire=30, key_builder=roster_cache_key)
 def read_players(db: Session = Depends(get_db)):
-    return db.query(models.Player).all()
+    # Fetch plain tuples of just the columns we serialize, skipping
+    # full ORM object construction. Returned as dicts so the cache
+    # backend can round-trip them through JSON.
+    rows = db.execute(
+        select(
+            models.Player.id,
+            models.Player.name,
+            models.Player.jersey_number,
+            models.Player.gender_match,
+        )
+    ).all()
+    return [row._asdict() for row in rows]
 
 @app.post("/calculate-stats/", response_model=List[PlayerStats])
 def calculate_stats(sequence: GameSequence):
@@ -37,4 +74,11 @@ def calculate_stats(sequence: GameSequence):
     Receives a list of raw events (clicks) and returns calculated stats.
     """
     stats = process_game_events(sequence.events)
-    return stats
\ No newline at end of file
+    # The engine already validated through PLAYER_STATS_LIST; dumping with
+    # the same cached adapter and returning a Response skips FastAPI's
+    # second response_model validation pass (the model still documents
+    # the response shape in OpenAPI)
+    return Response(
+        content=PLAYER_STATS_LIST.dump_json(stats),
+        media_type="application/json",
+    )
\ No newline at end of file
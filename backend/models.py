@@ -1,9 +1,9 @@
 from enum import Enum
 from datetime import datetime
 from sqlalchemy import Column, Integer, String, Float, ForeignKey, DateTime, Boolean, Enum as SAEnum
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.orm import relationship
 
-Base = declarative_base()
+from database import Base
 
 # --- Enums for Standardization ---
 class TeamSide(str, Enum):
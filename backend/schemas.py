@@ -1,25 +1,64 @@
 # backend/schemas.py
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 from typing import List, Optional
 from datetime import datetime
+from enum import IntEnum
 
 # --- Incoming Data (What the Frontend sends) ---
+class ActionCode(IntEnum):
+    # Integer-valued so the stats engine compares single ints instead of
+    # walking strings; pydantic validates the wire string once at ingest
+    CATCH = 0
+    PULL = 1
+    TURNOVER = 2
+    GOAL = 3
+    BLOCK = 4
+    OPPONENT_TURN = 5
+    OPPONENT_SCORE = 6
+
+    @classmethod
+    def _missing_(cls, value):
+        # The frontend sends lowercase action strings ("catch", "pull", ...)
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
+
+
 class EventCreate(BaseModel):
+    # Events are read-only once validated; forbidding extras catches
+    # frontend payload drift at the door
+    model_config = ConfigDict(frozen=True, extra='forbid')
+
     # We use string for player_name for now to keep it simple
-    player_name: str 
-    action_type: str  # "catch", "pull", "turnover"
+    player_name: str
+    action_type: ActionCode  # accepts "catch", "pull", "turnover", ...
     x: float
     y: float
     timestamp: datetime
 
 class GameSequence(BaseModel):
-    # A list of events represents one full point or game
-    events: List[EventCreate]
+    # A list of events represents one full point or game; an empty
+    # sequence is rejected at validation rather than deep in the engine
+    events: List[EventCreate] = Field(min_length=1)
+
+# --- Outgoing Data (What the Backend returns) ---
+class PlayerOut(BaseModel):
+    # Only the columns the frontend actually uses
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    jersey_number: Optional[int] = None
+    gender_match: Optional[str] = None
 
-# --- Outgoing Data (What the Backend calculates) ---
 class PlayerStats(BaseModel):
     player_name: str
     touches: int
     throwing_yards: float
     receiving_yards: float
-    turnovers: int
\ No newline at end of file
+    turnovers: int
+
+# Cached adapter: validates/serializes the whole stats list in one
+# pydantic-core call instead of per-model construction plus a second
+# response_model pass
+PLAYER_STATS_LIST = TypeAdapter(List[PlayerStats])
\ No newline at end of file
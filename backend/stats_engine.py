@@ -1,68 +1,136 @@
 # backend/stats_engine.py
-import pandas as pd
-import math
+import operator
+import sys
+from collections import defaultdict
 from typing import List
-from schemas import EventCreate, PlayerStats
 
-def calculate_distance(x1, y1, x2, y2):
-    """
-    Returns distance in yards using Pythagoras.
-    """
-    return math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+from schemas import PLAYER_STATS_LIST, ActionCode, EventCreate, PlayerStats
+
+N_ACTIONS = len(ActionCode)
+
+# numpy and numba are imported (and the kernel compiled) on the first
+# /calculate-stats/ call, not at boot: / and /players/ never need them,
+# and cache=True makes the compile a once-per-machine cost anyway
+_accumulate = None
+
+
+def _load_kernel():
+    global _accumulate
+    if _accumulate is not None:
+        return _accumulate
+
+    import math
+
+    import numpy as np
+    from numba import njit
+
+    # Plain ints for the kernel; numba can't type IntEnum members
+    CATCH = int(ActionCode.CATCH)
+    PULL = int(ActionCode.PULL)
+    TURNOVER = int(ActionCode.TURNOVER)
+
+    # Transition table: VALID_PASS[prev, curr] == 1 iff the pair counts as
+    # a completed pass. One table load replaces the two string comparisons.
+    VALID_PASS = np.zeros((N_ACTIONS, N_ACTIONS), dtype=np.uint8)
+    VALID_PASS[PULL, CATCH] = 1
+    VALID_PASS[CATCH, CATCH] = 1
+
+    # Explicit signature => eager compilation, and cache=True persists the
+    # machine code on disk so later process starts skip the JIT
+    @njit('Tuple((f8[:],f8[:],i8[:],i8[:]))(f8[:],f8[:],i1[:],i4[:],i8)', cache=True)
+    def _accumulate_impl(x, y, action, pid, n_players):
+        """
+        Native-code accumulation loop: credits yardage/touches/turnovers
+        into per-player arrays indexed by integer player id.
+        """
+        throw_yds = np.zeros(n_players, dtype=np.float64)
+        recv_yds = np.zeros(n_players, dtype=np.float64)
+        touches = np.zeros(n_players, dtype=np.int64)
+        turnovers = np.zeros(n_players, dtype=np.int64)
+
+        # Size-2 sliding window: keep the previous event in hot locals and
+        # shift them forward instead of re-indexing the arrays at i-1
+        px, py, pa, ppid = x[0], y[0], action[0], pid[0]
+
+        for i in range(1, x.shape[0]):
+            cx, cy, ca, cpid = x[i], y[i], action[i], pid[i]
+
+            # Logic: If the pair is a completed pass, the previous thrower
+            # gains Throwing Yards and the current catcher gains Receiving
+            # Yards.
+            if VALID_PASS[pa, ca]:
+                dx = cx - px
+                dy = cy - py
+                dist = math.sqrt(dx * dx + dy * dy)
+
+                throw_yds[ppid] += dist
+                recv_yds[cpid] += dist
+                touches[cpid] += 1
+
+            elif ca == TURNOVER:
+                turnovers[cpid] += 1
+
+            px, py, pa, ppid = cx, cy, ca, cpid
+
+        return throw_yds, recv_yds, touches, turnovers
+
+    _accumulate = _accumulate_impl
+    return _accumulate
+
 
 def process_game_events(events: List[EventCreate]) -> List[PlayerStats]:
     """
     Takes a list of raw events and returns aggregated stats per player.
     """
-    # 1. Convert to DataFrame for easier handling
-    data = [e.dict() for e in events]
-    df = pd.DataFrame(data)
-    
-    # 2. Sort by time to ensure order
-    df = df.sort_values(by='timestamp')
-    
-    # 3. Initialize stats dictionary
-    stats = {}
-    
-    # 4. Iterate through events to calculate yardage
-    # We need to look at the PREVIOUS event to calculate distance to CURRENT event
-    for i in range(1, len(df)):
-        prev_event = df.iloc[i-1]
-        curr_event = df.iloc[i]
-        
-        player = curr_event['player_name']
-        thrower = prev_event['player_name']
-        
-        # Initialize if not exists
-        if player not in stats:
-            stats[player] = {'touches': 0, 'throwing_yards': 0, 'receiving_yards': 0, 'turnovers': 0}
-        if thrower not in stats:
-            stats[thrower] = {'touches': 0, 'throwing_yards': 0, 'receiving_yards': 0, 'turnovers': 0}
-            
-        # Logic: If current is a catch, the previous thrower gains Throwing Yards
-        # and the current catcher gains Receiving Yards.
-        if curr_event['action_type'] == 'catch' and prev_event['action_type'] in ['catch', 'pull']:
-            dist = calculate_distance(prev_event['x'], prev_event['y'], curr_event['x'], curr_event['y'])
-            
-            # Credit Thrower
-            stats[thrower]['throwing_yards'] += dist
-            
-            # Credit Receiver
-            stats[player]['receiving_yards'] += dist
-            stats[player]['touches'] += 1
-            
-        elif curr_event['action_type'] == 'turnover':
-            stats[player]['turnovers'] += 1
-
-    # 5. Convert back to list of Pydantic models
-    results = []
-    for name, data in stats.items():
-        results.append(PlayerStats(
-            player_name=name,
-            touches=data['touches'],
-            throwing_yards=round(data['throwing_yards'], 1),
-            receiving_yards=round(data['receiving_yards'], 1),
-            turnovers=data['turnovers']
-        ))
-        
-    return results
\ No newline at end of file
+    # 0. Yardage needs at least one event pair; bail before sorting or
+    # touching numpy on the common "no events yet" call
+    n = len(events)
+    if n < 2:
+        return []
+
+    import numpy as np  # deferred with the kernel, see _load_kernel
+
+    accumulate = _load_kernel()
+
+    # 1. Sort by time to ensure order (the models are already typed,
+    # so we read attributes directly instead of building a DataFrame)
+    evs = sorted(events, key=operator.attrgetter('timestamp'))
+
+    # 2. Encode everything the hot loop needs as numpy arrays: coordinates,
+    # action codes, and contiguous integer ids per player name. One fused
+    # pass fills all four arrays instead of re-walking the events per array.
+    xs = np.empty(n, dtype=np.float64)
+    ys = np.empty(n, dtype=np.float64)
+    actions = np.empty(n, dtype=np.int8)
+    pids = np.empty(n, dtype=np.int32)
+
+    # defaultdict hands out the next id on first sight, so assigning a
+    # player id never branches; interning the names makes the repeated
+    # dict lookups hash by pointer instead of by characters
+    name_to_idx = defaultdict(lambda: len(name_to_idx))
+    for i, e in enumerate(evs):
+        xs[i] = e.x
+        ys[i] = e.y
+        actions[i] = e.action_type  # already an ActionCode int
+        pids[i] = name_to_idx[sys.intern(e.player_name)]
+
+    names = list(name_to_idx)  # insertion order == id order
+
+    # 3. Run the compiled kernel; stats come back as four parallel
+    # per-player arrays (struct-of-arrays, indexed by player id)
+    throw_yds, recv_yds, touches, turnovers = accumulate(
+        xs, ys, actions, pids, len(names)
+    )
+
+    # 4. Zip the id-ordered names back against the arrays and validate
+    # the whole batch in one adapter call
+    return PLAYER_STATS_LIST.validate_python([
+        {
+            'player_name': name,
+            'touches': int(tch),
+            'throwing_yards': round(float(thr), 1),
+            'receiving_yards': round(float(rcv), 1),
+            'turnovers': int(tos),
+        }
+        for name, tch, thr, rcv, tos in zip(names, touches, throw_yds, recv_yds, turnovers)
+    ])